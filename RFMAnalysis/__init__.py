@@ -0,0 +1 @@
+from .rfm_analysis import RFMAnalysis
@@ -0,0 +1,34 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+"""
+Compiled helpers for RFMAnalysis. The module is optional: when it is not built, RFMAnalysis
+falls back to the equivalent NumPy expressions.
+"""
+
+from libc.stdint cimport int8_t, int16_t, int32_t
+
+
+cpdef void score_and_segment(const int8_t[:] R,
+                             const int8_t[:] F,
+                             const int8_t[:] M,
+                             int32_t base,
+                             int16_t[:] score_out,
+                             int32_t[:] segment_out) noexcept nogil:
+    """
+    Fills, for each customer, the RFM score and the packed RFM segment in a single loop over
+    the R, F and M quantiles.
+
+    Parameters
+    ----------
+    R, F, M : int8 arrays
+        Quantiles of each customer.
+    base : int
+        Power of ten used to pack the quantiles into the segment.
+    score_out, segment_out : arrays
+        Outputs, of the same length as R.
+    """
+
+    cdef Py_ssize_t i
+
+    for i in range(R.shape[0]):
+        score_out[i] = R[i] + F[i] + M[i]
+        segment_out[i] = (R[i] * base + F[i]) * base + M[i]
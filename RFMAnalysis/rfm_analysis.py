@@ -0,0 +1,504 @@
+import os
+import tempfile
+
+import pandas as pd
+import numpy as np
+
+try:
+    from ._rfm import score_and_segment as _compiled_score_and_segment
+except ImportError:
+    _compiled_score_and_segment = None
+
+# Scores of 3 and below are `Demands Activation`, every further point moves one segment up,
+# and 9 and above are `Can't Loose Them`
+_SEGMENT_BINS = [-np.inf, 3, 4, 5, 6, 7, 8, np.inf]
+_SEGMENT_NAMES = ['Demands Activation',
+                  'Requires Attention',
+                  'Promising',
+                  'Potential',
+                  'Loyal/Commited',
+                  'Champions',
+                  "Can't Loose Them"]
+
+def _score_and_segment(R, F, M, base):
+    """
+    Returns the RFM score and the packed RFM segment for the given quantiles. Uses the
+    compiled `_rfm` module when it is built.
+    
+    Parameters
+    ----------
+    R, F, M : np.ndarray
+        int8 quantiles of each customer.
+    base : int
+        Power of ten used to pack the quantiles into the segment.
+    """
+    
+    R, F, M = (np.ascontiguousarray(codes, dtype = np.int8) for codes in (R, F, M))
+    
+    if _compiled_score_and_segment is not None:
+        score = np.empty(len(R), dtype = np.int16)
+        segment = np.empty(len(R), dtype = np.int32)
+        _compiled_score_and_segment(R, F, M, base, score, segment)
+        return score, segment
+    
+    score = R.astype(np.int16) + F + M
+    segment = (R.astype(np.int32) * base + F) * base + M
+    
+    return score, segment
+
+class RFMAnalysis:
+    """
+    An instance of this class can be used to perform RFM analysis, with different output types, 
+    such as tables and plots.
+    
+    Attributes
+    ----------
+    data_path : str
+        path to the dataframe
+    customer : str
+        column name for `customer` data
+    revenue : str
+        column name for `revenue` data
+    date : str
+        column name for `date` data
+        
+    Methods
+    -------
+    problemsolver(self)
+    
+    best_customers(self, n, n_quantiles = 4)
+        
+    worst_customers(self, n, n_quantiles = 4)
+    
+    table(self, n_quantiles = 4)
+    
+    table_grouped(self, n_quantiles = 4)
+    
+    plot_revenue(self)
+    
+    plot_segments(self, n_quantiles = 4)
+    
+    plot_traits(self, n_quantiles = 4)
+    
+    plot_segments_lines(self, n_quantiles = 4)
+    """
+    
+    def __init__(self, data_path, customer, date, revenue, cache = True):
+        """
+        Initializes the object.
+        
+        Parameters
+        ----------
+        data_path : str
+            Path to the CSV file
+        customer : str
+            name of the event column 
+        date : str
+            name of the time column 
+        revenue : str
+            name of the group_by column 
+        cache : bool
+            Whether to keep a Feather copy of the used columns next to the CSV file and load
+            it instead of parsing the CSV again, as long as the CSV has not changed since
+        """
+        
+        try:
+            self.data = self.__read(data_path, customer, date, revenue, cache)
+        except FileNotFoundError:
+            print("Error | Could not find the CSV file. Please, check that the requested file exists and is located in the working directory")
+            return
+        except (KeyError, ValueError):
+            columns = None
+            
+            # Only a path can be read again to find the missing columns, a buffer is consumed
+            if isinstance(data_path, (str, os.PathLike)):
+                try:
+                    columns = pd.read_csv(data_path, nrows = 0).columns
+                except (OSError, ValueError):
+                    pass
+            
+            if columns is None:
+                print("Error | Could not locate `customer`, `date` or `revenue` column. Please, check input.")
+                return
+            
+            if customer not in columns:
+                print("Error | Could not locate `customer` column. Please, check input.")
+                
+            if date not in columns:
+                print("Error | Could not locate `date` column. Please, check input.")
+            
+            if revenue not in columns:
+                print("Error | Could not locate `revenue` column. Please, check input.")
+            
+            if {customer, date, revenue}.issubset(columns):
+                print("Error | Could not locate `date` column to parse dates")
+            return
+        
+        if not pd.api.types.is_datetime64_any_dtype(self.data[date]):
+            print("Error | Could not locate `date` column to parse dates")
+            return
+        
+        self.customer = customer
+        self.date = date
+        self.revenue = revenue
+        self.__tables = {}
+        
+        # Days between each row and the latest date, shared by the tables of all quantiles. Rows
+        # without a date get the largest int32, so they never win the per-customer minimum
+        dates = self.data[date]
+        days_since = (dates.max() - dates).dt.days
+        self.__days_since = days_since.fillna(np.iinfo(np.int32).max).to_numpy().astype(np.int32)
+        
+    @staticmethod
+    def __read(data_path, customer, date, revenue, cache):
+        """
+        Reads the customer, date and revenue columns of the CSV file, with the customer column
+        as a categorical. With `cache`, the columns are also written to `<data_path>.feather`,
+        which later reads load instead while it is newer than the CSV and has these columns.
+        """
+        
+        columns = [customer, date, revenue]
+        cache_path = None
+        
+        if cache and isinstance(data_path, (str, os.PathLike)) and os.path.isfile(data_path):
+            cache_path = os.fspath(data_path) + '.feather'
+        
+        if cache_path and os.path.isfile(cache_path) \
+                and os.path.getmtime(cache_path) >= os.path.getmtime(data_path):
+            try:
+                data = pd.read_feather(cache_path)
+            except (OSError, ValueError):
+                # A corrupt or incomplete cache is parsed again from the CSV and rewritten
+                data = None
+            
+            if data is not None and set(columns).issubset(data.columns):
+                return data[columns]
+        
+        data = pd.read_csv(data_path,
+                           engine = 'pyarrow',
+                           usecols = columns,
+                           parse_dates = [date])
+        
+        # Categories are kept in order of first appearance instead of being sorted, since the
+        # table is ordered by RFM_Segment anyway
+        codes, customers = pd.factorize(data[customer], sort = False)
+        data[customer] = pd.Categorical.from_codes(codes, categories = customers)
+        
+        if cache_path:
+            # Written to a temporary file first, so other readers never see a partial cache
+            tmp_path = None
+            try:
+                fd, tmp_path = tempfile.mkstemp(dir = os.path.dirname(os.path.abspath(cache_path)),
+                                                suffix = '.tmp')
+                os.close(fd)
+                data.to_feather(tmp_path)
+                os.replace(tmp_path, cache_path)
+            except OSError:
+                if tmp_path and os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        
+        return data
+    
+    def problemsolver(self):
+        """
+        Plots all available charts
+        """
+        self.plot_revenue()
+        self.plot_segments()
+        self.plot_traits()
+        self.plot_segments_lines()
+        
+        best_3 = list(self.best_customers(3)[self.customer])
+        worst_3 = list(self.worst_customers(3)[self.customer])
+        print("Best:", ", ".join(best_3))
+        print("Worst:", ", ".join(worst_3))
+    
+    def best_customers(self, n, n_quantiles = 4):
+        """
+        Outputs the best `n` customers. 
+        
+        Parameters
+        ----------
+        n : int
+            Number of the best customers to return.
+        n_quantiles: int
+            Number of quantiles to use during analysis.
+        """
+        
+        rfm = self.__table(n_quantiles)
+        
+        if rfm is None:
+            return
+        
+        best = rfm.nlargest(n, 'RFM_Segment')
+            
+        return best[[self.customer, "RFM_Score"]]
+    
+    def worst_customers(self, n, n_quantiles = 4):
+        """
+        Outputs the worst `n` customers. 
+        
+        Parameters
+        ----------
+        n : int
+            Number of the worst customers to return.
+        n_quantiles: int
+            Number of quantiles to use during analysis.
+        """
+        
+        rfm = self.__table(n_quantiles)
+        
+        if rfm is None:
+            return
+        
+        worst = rfm.nsmallest(n, 'RFM_Segment', keep = 'last')
+            
+        return worst[[self.customer, "RFM_Score"]]
+        
+    def table(self, n_quantiles = 4):
+        """
+        Returns an aggregate table with Recency, Frequency and Monetary columns. In addition, 
+        it outputs scores in the same table for each customer.
+        
+        Parameters
+        ----------
+        n_quantiles: int
+            Number of quantiles to use during analysis.
+        """
+        
+        rfm = self.__table(n_quantiles)
+        
+        if rfm is None:
+            return
+        
+        return rfm.sort_values('RFM_Segment', ascending = False, kind = 'stable')
+    
+    def __table(self, n_quantiles):
+        """
+        Returns the cached, unsorted aggregate table for `n_quantiles`, computing it on first
+        use. The returned frame is shared between calls and must not be modified in place.
+        """
+        
+        if n_quantiles not in self.__tables:
+            rfm = self.__compute_table(n_quantiles)
+            
+            if rfm is None:
+                return
+            
+            self.__tables[n_quantiles] = rfm
+        
+        return self.__tables[n_quantiles]
+    
+    def __compute_table(self, n_quantiles):
+        
+        rfm = self.__aggregate()
+        
+        try:
+            rfm['R'] = self.__quantile_codes(rfm['Recency'].to_numpy(), n_quantiles)
+            rfm['F'] = n_quantiles + 1 - self.__quantile_codes(rfm['Frequency'].to_numpy(), n_quantiles)
+            rfm['M'] = n_quantiles + 1 - self.__quantile_codes(rfm['Monetary'].to_numpy(), n_quantiles)
+        except ValueError:
+            print("Error | too many quantiles provided. Try a smaller value.")
+            return None
+        
+        # Packs the codes into one integer that reads as the concatenated digits, e.g. 431 for
+        # R = 4, F = 3, M = 1, with each code zero-padded to the width of `n_quantiles`
+        base = 10 ** len(str(n_quantiles))
+        score, segment = _score_and_segment(rfm['R'].to_numpy(),
+                                            rfm['F'].to_numpy(),
+                                            rfm['M'].to_numpy(),
+                                            base)
+        
+        rfm['RFM_Score'] = score
+        rfm['RFM_Segment'] = segment
+        rfm['Segment_Name'] = pd.cut(rfm['RFM_Score'],
+                                     bins = _SEGMENT_BINS,
+                                     labels = _SEGMENT_NAMES,
+                                     ordered = False)
+        
+        return rfm
+    
+    def __aggregate(self):
+        """
+        Returns the Recency, Frequency and Monetary value of each customer, computed with one
+        vectorized pass per value over the category codes of the customer column.
+        """
+        
+        customers = self.data[self.customer]
+        codes = customers.cat.codes.to_numpy()
+        n_customers = len(customers.cat.categories)
+        days_since = self.__days_since
+        revenue = self.data[self.revenue].to_numpy()
+        
+        # Rows without a customer have the code -1 and are left out, as a groupby would do
+        known = codes >= 0
+        if not known.all():
+            codes, days_since, revenue = codes[known], days_since[known], revenue[known]
+        
+        recency = np.full(n_customers, np.iinfo(np.int32).max, dtype = np.int32)
+        np.minimum.at(recency, codes, days_since)
+        frequency = np.bincount(codes, minlength = n_customers).astype(np.int32)
+        
+        # Missing revenue counts as 0, as in a sum that skips NaN
+        if revenue.dtype.kind == 'f':
+            revenue = np.where(np.isnan(revenue), 0, revenue)
+        
+        monetary = np.bincount(codes, weights = revenue, minlength = n_customers)
+        
+        if revenue.dtype.kind in 'iu':
+            monetary = monetary.astype(revenue.dtype)
+        
+        rfm = pd.DataFrame({self.customer: pd.Categorical.from_codes(np.arange(n_customers),
+                                                                     dtype = customers.dtype),
+                            'Recency': recency,
+                            'Frequency': frequency,
+                            'Monetary': monetary})
+        
+        # Customers without any row, or without any dated row, have no Recency and are left out
+        # rather than reported with the int32 fill value of missing dates
+        kept = (frequency > 0) & (recency != np.iinfo(np.int32).max)
+        if not kept.all():
+            rfm = rfm[kept].reset_index(drop = True)
+        
+        return rfm
+    
+    @staticmethod
+    def __quantile_codes(values, n_quantiles):
+        """
+        Returns the 1-based quantile of each value, binned the same way as `pd.qcut`. Raises
+        ValueError when the quantile edges are not unique.
+        """
+        
+        # Like `pd.qcut`, round the probabilities up when they are not exact in base 2, so that
+        # values lying on an edge land in the same quantile
+        probs = np.linspace(0, 1, n_quantiles + 1)
+        probs = np.where(n_quantiles * probs != np.arange(n_quantiles + 1), np.nextafter(probs, 1), probs)
+        edges = np.quantile(values, probs)
+        
+        if (np.diff(edges) == 0).any():
+            raise ValueError("Quantile edges must be unique")
+        
+        return (np.searchsorted(edges[1:-1], values, side = 'left') + 1).astype(np.int8)
+    
+    def table_grouped(self, n_quantiles = 4):
+        """
+        Returns an a grouped table with Recency, Frequency and Monetary columns with mean
+        function applied to each.
+        
+        Parameters
+        ----------
+        n_quantiles: int
+            Number of quantiles to use during analysis.
+        """
+        
+        rfm = self.__table(n_quantiles)
+        
+        if rfm is None:
+            return
+        
+        agg_dict = {'Recency': 'mean',
+                    'Frequency': 'mean',
+                    'Monetary': ['mean', 'count']
+                   }
+
+        grouped_by = rfm.groupby('Segment_Name', observed = True).agg(agg_dict).round(1)
+        grouped_by.columns = ['RecencyMean','FrequencyMean','MonetaryMean', 'Count']
+        return grouped_by
+    
+    def plot_revenue(self):
+        """
+        Plot the revenue.
+        """
+        
+        import matplotlib.pyplot as plt
+        
+        counts, edges = np.histogram(self.data[self.revenue].dropna().to_numpy(), bins = 10)
+        plt.bar(edges[:-1], counts, width = np.diff(edges), align = 'edge')
+        plt.grid(True)
+        plt.title('Histogram of Revenue')
+        plt.show()
+        
+    def plot_segments(self, n_quantiles = 4):
+        """
+        Plot segments.
+        
+        Parameters
+        ----------
+        n_quantiles: int
+            Number of quantiles to use during analysis.
+        """
+        
+        import matplotlib.pyplot as plt
+        import squarify
+        
+        rfm = self.__table(n_quantiles)
+        
+        if rfm is None:
+            return
+        
+        counts = rfm['Segment_Name'].value_counts(sort = False)
+        counts = counts[counts > 0]
+        labels = [RFMAnalysis.__default_score_codes[code] for code in counts.index.codes]
+        
+        fig = plt.gcf()
+        ax = fig.add_subplot()
+        
+        squarify.plot(sizes = counts, label = labels, alpha = .6 )
+        plt.title("RFM Segments", fontsize = 18, fontweight = "bold") 
+        plt.axis('off')
+        plt.show()
+    
+    def plot_traits(self, n_quantiles = 4):
+        """
+        Plot density charts for Recency, Frequency, Monetary.
+        
+        Parameters
+        ----------
+        n_quantiles: int
+            Number of quantiles to use during analysis.
+        """
+        
+        import matplotlib.pyplot as plt
+        import seaborn as sns
+        
+        rfm = self.__table(n_quantiles)
+        
+        if rfm is None:
+            return
+        
+        fig, ax = plt.subplots(nrows = 3, ncols = 1, figsize = (10,10))
+        sns.distplot(rfm['Recency'], ax = ax[0])
+        sns.distplot(rfm['Frequency'], ax = ax[1]) 
+        sns.distplot(rfm['Monetary'], ax = ax[2])
+        plt.show()
+            
+    def plot_segments_lines(self, n_quantiles = 4):
+        """
+        Plot lines for each segment. 
+        
+        Parameters
+        ----------
+        n_quantiles: int
+            Number of quantiles to use during analysis.
+        """
+        
+        import matplotlib.pyplot as plt
+        
+        rfm = self.__table(n_quantiles)
+        
+        if rfm is None:
+            return
+        
+        rfm_segments = rfm.groupby('RFM_Segment', as_index = False).size()
+        rfm_segments = rfm_segments.rename(columns = {'size': self.customer})
+        rfm_segments.plot.barh(x = 'RFM_Segment', y = self.customer)
+        plt.show()
+        
+    # Labels of the segments, in the order of `_SEGMENT_NAMES`
+    __default_score_codes = ["Demans\nActivation",
+                             "Requires\nAttention",
+                             "Promising",
+                             "Potential",
+                             "Loyal/\nCommitted",
+                             "Chapmions",
+                             "Can't lose\nthem"]
\ No newline at end of file
@@ -1,20 +1,28 @@
-from setuptools import setup, find_packages
+from setuptools import setup, find_packages, Extension
+
+# The compiled kernel is optional: without Cython or a C compiler the package falls back to NumPy
+try:
+    from Cython.Build import cythonize
+    ext_modules = cythonize([Extension("RFMAnalysis._rfm", ["RFMAnalysis/_rfm.pyx"])])
+    
+    # Set after cythonize, which does not carry the flag over to the extensions it returns
+    for extension in ext_modules:
+        extension.optional = True
+except ImportError:
+    ext_modules = []
 
 setup(
     author = "Petros Tepoyan",
     description = "A package for RFMAnalaysis",
     name = "RFMAnalysis",
     version = "0.1.0",
-    packages = find_packages(include = [
-        "pandas", 
-        "numpy",
-        "squarify", 
-        "seaborn", 
-        "matplotlib"]),
+    packages = find_packages(include = ["RFMAnalysis", "RFMAnalysis.*"]),
     install_requires = [
         "pandas", 
         "numpy",
         "squarify", 
         "seaborn", 
-        "matplotlib"]
+        "matplotlib",
+        "pyarrow"],
+    ext_modules = ext_modules
 )
\ No newline at end of file